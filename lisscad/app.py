@@ -29,7 +29,7 @@ from lisscad.misc import (
     EXECUTABLE_OPENSCAD,
     compose_openscad_command,
 )
-from lisscad.py_to_scad import LineGen, transpile
+from lisscad.py_to_scad import transpile_to
 from lisscad.vocab.base import mirror, module, union
 
 #############
@@ -300,16 +300,17 @@ def _refine_nonmodule(
         yield _flatten(asset, flip_chiral=True, **kwargs)
 
 
-def _asset_to_scad(asset: Asset) -> LineGen:
-    """Put a blank line between assets."""
-    for expression in asset.content():
-        yield from transpile(expression)
-        yield ''
+def _write_scad(asset: Asset, file: Path) -> None:
+    """Write OpenSCAD code to file, one top-level expression at a time.
 
+    Put a blank line between expressions.
 
-def _write_scad(asset: Asset, file: Path) -> None:
-    scad = '\n'.join(_asset_to_scad(asset))
-    file.write_text(scad)
+    """
+    with file.open('w') as f:
+        for i, expression in enumerate(asset.content()):
+            if i:
+                f.write('\n')
+            transpile_to(expression, f)
 
 
 def _render(q: Queue, asset: str, step: str, cmd: list[str], path: str):
@@ -41,7 +41,7 @@ Tuple3D = tuple[float, float, float]
 Tuple4D = tuple[float, float, float, float]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class SCADTerm:
     """A mix-in for classes that match OpenSCAD’s wording."""
 
@@ -51,77 +51,82 @@ class SCADTerm:
 class BaseExpression:
     """A base class for all of lisscad’s precursors."""
 
+    __slots__ = ()
+
 
 class Base2D(BaseExpression):
-    pass
+    __slots__ = ()
 
 
 class Base3D(BaseExpression):
-    pass
+    __slots__ = ()
 
 
 class BaseND(BaseExpression):
-    pass
+    __slots__ = ()
 
 
 class BaseModifier(BaseExpression):
     """A modifier such as “%”, “#” or “!”. Scoped for just one expression."""
 
+    __slots__ = ()
+    symbol: ClassVar[str]
+
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class BaseModifier2D(Base2D, BaseModifier):
     child: LiteralExpressionNon3D
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class BaseModifier3D(Base3D, BaseModifier):
     child: LiteralExpressionNon2D
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class BaseBoolean2D(Base2D, SCADTerm):
     children: tuple[LiteralExpressionNon3D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class BaseBoolean3D(Base3D, SCADTerm):
     children: tuple[LiteralExpressionNon2D, ...]
 
 
 class BaseTransformation2D(Base2D):
-    pass
+    __slots__ = ()
 
 
 class BaseTransformation3D(Base3D):
-    pass
+    __slots__ = ()
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class BaseMirror(BaseExpression, SCADTerm):
     scad = SCADAdapter('mirror', 'children', {'vector': 'v'})
     vector: tuple[int, int, int]  # Coefficients by axis.
 
 
 class BaseShape2D(Base2D):
-    pass
+    __slots__ = ()
 
 
 class BaseShape3D(Base3D):
-    pass
+    __slots__ = ()
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class BaseExtrusion(Base3D):
     children: tuple[LiteralExpressionNon3D, ...]
     convexity: PositiveInt = 1
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class BaseModuleDefinition(BaseExpression):
     name: str
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class BaseModuleCall(BaseExpression):
     name: str
 
@@ -131,31 +136,31 @@ class BaseModuleCall(BaseExpression):
 ################################
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Comment(BaseND):
     content: tuple[str, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Commented2D(Base2D):
     comment: Comment
     subject: LiteralExpressionNon3D
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Commented3D(Base3D):
     comment: Comment
     subject: LiteralExpressionNon2D
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class SpecialVariable(BaseND):
     variable: str
     assignment_preview: float | None = None
     assignment_render: float | None = None
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Echo(BaseND):
     content: tuple[str, ...]
 
@@ -165,24 +170,24 @@ class Echo(BaseND):
 ################
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Background2D(BaseModifier2D):
-    pass
+    symbol = '%'
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Debug2D(BaseModifier2D):
-    pass
+    symbol = '#'
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Root2D(BaseModifier2D):
-    pass
+    symbol = '!'
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Disable2D(BaseModifier2D):
-    pass
+    symbol = '*'
 
 
 LiteralModifier2D = Background2D | Debug2D | Root2D | Disable2D
@@ -192,24 +197,24 @@ LiteralModifier2D = Background2D | Debug2D | Root2D | Disable2D
 ################
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Background3D(BaseModifier3D):
-    pass
+    symbol = '%'
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Debug3D(BaseModifier3D):
-    pass
+    symbol = '#'
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Root3D(BaseModifier3D):
-    pass
+    symbol = '!'
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Disable3D(BaseModifier3D):
-    pass
+    symbol = '*'
 
 
 LiteralModifier3D = Background3D | Debug3D | Root3D | Disable3D
@@ -219,18 +224,18 @@ LiteralModifier3D = Background3D | Debug3D | Root3D | Disable3D
 ###############
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Union2D(BaseBoolean2D):
     # An OpenSCAD union, not a typing.Union.
     scad = SCADAdapter('union', 'children')
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Difference2D(BaseBoolean2D):
     scad = SCADAdapter('difference', 'children')
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Intersection2D(BaseBoolean2D):
     scad = SCADAdapter('intersection', 'children')
 
@@ -242,17 +247,17 @@ LiteralBoolean2D = Union2D | Difference2D | Intersection2D
 ###############
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Union3D(BaseBoolean3D):
     scad = SCADAdapter('union', 'children')
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Difference3D(BaseBoolean3D):
     scad = SCADAdapter('difference', 'children')
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Intersection3D(BaseBoolean3D):
     scad = SCADAdapter('intersection', 'children')
 
@@ -264,27 +269,27 @@ LiteralBoolean3D = Union3D | Difference3D | Intersection3D
 #############
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Circle(BaseShape2D, SCADTerm):
     scad = SCADAdapter('circle', field_names={'radius': 'r'})
     radius: float
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Square(BaseShape2D, SCADTerm):
     scad = SCADAdapter('square')
     size: float
     center: bool = False
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Rectangle(BaseShape2D, SCADTerm):
     scad = SCADAdapter('square')  # Sic.
     size: Tuple2D
     center: bool = False
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Polygon(BaseShape2D, SCADTerm):
     scad = SCADAdapter('polygon')
     points: tuple[Tuple2D, ...]
@@ -292,7 +297,7 @@ class Polygon(BaseShape2D, SCADTerm):
     convexity: PositiveInt = 1
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Text(BaseShape2D, SCADTerm):
     scad = SCADAdapter('text')
     text: str
@@ -306,7 +311,7 @@ class Text(BaseShape2D, SCADTerm):
     script: str = 'latin'
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Import2D(BaseShape2D, SCADTerm):
     scad = SCADAdapter('import')
     file: Path
@@ -314,7 +319,7 @@ class Import2D(BaseShape2D, SCADTerm):
     convexity: PositiveInt = 1
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Projection(BaseShape2D, SCADTerm):
     scad = SCADAdapter('projection', 'child')
     child: LiteralExpressionNon2D
@@ -330,20 +335,20 @@ LiteralShape2D = (
 #############
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Sphere(BaseShape3D, SCADTerm):
     scad = SCADAdapter('sphere', field_names={'radius': 'r'})
     radius: float
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Cube(BaseShape3D, SCADTerm):
     scad = SCADAdapter('cube')
     size: Tuple3D
     center: bool = False
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Cylinder(BaseShape3D, SCADTerm):
     scad = SCADAdapter('cylinder', field_names={'radius': 'r', 'height': 'h'})
     radius: float
@@ -351,7 +356,7 @@ class Cylinder(BaseShape3D, SCADTerm):
     center: bool = False
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Frustum(BaseShape3D, SCADTerm):
     scad = SCADAdapter(
         'cylinder',
@@ -363,7 +368,7 @@ class Frustum(BaseShape3D, SCADTerm):
     center: bool = False
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Polyhedron(BaseShape3D, SCADTerm):
     scad = SCADAdapter('polyhedron')
     points: tuple[Tuple3D, ...]
@@ -371,7 +376,7 @@ class Polyhedron(BaseShape3D, SCADTerm):
     convexity: PositiveInt = 1
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Import3D(BaseShape3D, SCADTerm):
     scad = SCADAdapter('import')
     file: Path
@@ -379,7 +384,7 @@ class Import3D(BaseShape3D, SCADTerm):
     convexity: PositiveInt = 1
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class LinearExtrusion(BaseExtrusion, SCADTerm):
     scad = SCADAdapter('linear_extrude', 'children')
     height: PositiveFloat = 100  # Default not documented in OpenSCAD manual.
@@ -389,13 +394,13 @@ class LinearExtrusion(BaseExtrusion, SCADTerm):
     scale: PositiveFloat = 1
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class RotationalExtrusion(BaseExtrusion, SCADTerm):
     scad = SCADAdapter('rotate_extrude', 'children')
     angle: float = tau  # Not called “a” in OpenSCAD.
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Surface(BaseShape3D, SCADTerm):
     scad = SCADAdapter('surface')
     file: Path
@@ -421,61 +426,61 @@ LiteralShape3D = (
 ######################
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Translation2D(BaseTransformation2D, SCADTerm):
     scad = SCADAdapter('translate', 'children', {'vector': 'v'})
     vector: Tuple2D
     children: tuple[LiteralExpressionNon3D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Rotation2D(BaseTransformation2D, SCADTerm):
     scad = SCADAdapter('rotate', 'children', {'angle': 'a'})
     angle: float  # Called “a” in OpenSCAD; cf. RotationalExtrusion.
     children: tuple[LiteralExpressionNon3D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Scaling2D(BaseTransformation2D, SCADTerm):
     scad = SCADAdapter('scale', 'children', {'vector': 'v'})
     vector: Tuple2D
     children: tuple[LiteralExpressionNon3D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Size2D(BaseTransformation2D, SCADTerm):
     scad = SCADAdapter('resize', 'children', {'vector': 'newsize'})
     vector: Tuple2D
     children: tuple[LiteralExpressionNon3D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Mirror2D(BaseTransformation2D, BaseMirror):
     children: tuple[LiteralExpressionNon3D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class AffineTransformation2D(BaseTransformation2D, SCADTerm):
     scad = SCADAdapter('multmatrix', 'children', {'matrix': 'm'})
     matrix: tuple[Tuple4D, ...]
     children: tuple[LiteralExpressionNon3D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Color2D(BaseTransformation2D, SCADTerm):
     scad = SCADAdapter('color', 'children', {'color': 'c'})
     color: Tuple4D | str
     children: tuple[LiteralExpressionNon3D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class RoundedOffset(BaseTransformation2D, SCADTerm):
     scad = SCADAdapter('offset', 'children', {'distance': 'r'})
     distance: float
     children: tuple[LiteralExpressionNon3D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class AngledOffset(BaseTransformation2D, SCADTerm):
     scad = SCADAdapter('offset', 'children', {'distance': 'delta'})
     distance: float
@@ -483,13 +488,13 @@ class AngledOffset(BaseTransformation2D, SCADTerm):
     chamfer: bool = False
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Hull2D(BaseTransformation2D, SCADTerm):
     scad = SCADAdapter('hull', 'children')
     children: tuple[LiteralExpressionNon3D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class MinkowskiSum2D(BaseTransformation2D, SCADTerm):
     scad = SCADAdapter('minkowski', 'children')
     children: tuple[LiteralExpressionNon3D, ...]
@@ -515,67 +520,67 @@ LiteralTransformation2D = (
 ######################
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Translation3D(BaseTransformation3D, SCADTerm):
     scad = SCADAdapter('translate', 'children', {'vector': 'v'})
     vector: Tuple3D
     children: tuple[LiteralExpressionNon2D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Rotation3D(BaseTransformation3D, SCADTerm):
     scad = SCADAdapter('rotate', 'children', {'angle': 'a'})
     angle: Tuple3D
     children: tuple[LiteralExpressionNon2D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Scaling3D(BaseTransformation3D, SCADTerm):
     scad = SCADAdapter('scale', 'children', {'vector': 'v'})
     vector: Tuple3D
     children: tuple[LiteralExpressionNon2D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Size3D(BaseTransformation3D, SCADTerm):
     scad = SCADAdapter('resize', 'children', {'vector': 'newsize'})
     vector: Tuple3D
     children: tuple[LiteralExpressionNon2D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Mirror3D(BaseTransformation3D, BaseMirror):
     children: tuple[LiteralExpressionNon2D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class AffineTransformation3D(BaseTransformation3D, SCADTerm):
     scad = SCADAdapter('multmatrix', 'children', {'matrix': 'm'})
     matrix: tuple[Tuple4D, ...]
     children: tuple[LiteralExpressionNon2D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Color3D(BaseTransformation3D, SCADTerm):
     scad = SCADAdapter('color', 'children', {'color': 'c'})
     color: Tuple4D | str
     children: tuple[LiteralExpressionNon2D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Hull3D(BaseTransformation3D, SCADTerm):
     scad = SCADAdapter('hull', 'children')
     children: tuple[LiteralExpressionNon2D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class MinkowskiSum3D(BaseTransformation3D, SCADTerm):
     scad = SCADAdapter('minkowski', 'children')
     children: tuple[LiteralExpressionNon2D, ...]
     convexity: PositiveInt = 1
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class Rendering3D(BaseTransformation3D, SCADTerm):
     # A “render” operation does not change geometry and is not listed as a
     # transformation in the OpenSCAD cheat sheet, but is applied like one.
@@ -602,12 +607,12 @@ LiteralTransformation3D = (
 ##############
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class ModuleDefinition2D(Base2D, BaseModuleDefinition):
     children: tuple[LiteralExpressionNon3D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class ModuleCall2D(Base2D, BaseModuleCall):
     children: tuple[LiteralExpressionNon3D, ...]
 
@@ -619,12 +624,12 @@ LiteralModule2D = ModuleDefinition2D | ModuleCall2D
 ##############
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class ModuleDefinition3D(Base3D, BaseModuleDefinition):
     children: tuple[LiteralExpressionNon2D, ...]
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class ModuleCall3D(Base3D, BaseModuleCall):
     children: tuple[LiteralExpressionNon2D, ...]
 
@@ -636,12 +641,12 @@ LiteralModule3D = ModuleDefinition3D | ModuleCall3D
 ###########################
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class ModuleCallND(BaseND, BaseModuleCall):
     pass
 
 
-@dantaclass(frozen=True)
+@dantaclass(frozen=True, slots=True)
 class ModuleChildren(BaseND):
     pass
 
@@ -1,13 +1,14 @@
 """Utilities for working directly with lisscad’s dataclasses."""
 
-from typing import Any, Type, cast
+from numbers import Number
+from typing import Any, NoReturn, Type, cast
 
 import lisscad.data.inter as d
 from lisscad.exc import DimensionalityMismatchError, DimensionalityZeroError
 
 
 def dimensionality(
-    verb_base: str, *expressions, verb_first='', verb_rest=''
+    verb_base: str, expressions: tuple, verb_first='', verb_rest=''
 ) -> int:
     """Determine the common dimensionality of children."""
     if not expressions:
@@ -15,40 +16,51 @@ def dimensionality(
             f'Cannot {verb_rest or verb_base} without operands.'
         )
 
-    two: list[int] = []
-    three: list[int] = []
+    n2 = n3 = 0
+    first2 = first3 = 0
 
     for i, e in enumerate(expressions):
-        verb = verb_first or verb_base
-        if i:
-            verb = verb_rest or verb_base
-
-        if isinstance(e, d.Base2D):
-            two.append(i)
-        elif isinstance(e, d.Base3D):
-            three.append(i)
-        elif isinstance(e, d.BaseND):
-            pass
-        else:
+        n = _DIMENSIONS.get(type(e))
+        if n is None:
+            n = _classify(type(e))
+        if n == 2:
+            if not n2:
+                first2 = i
+            n2 += 1
+        elif n == 3:
+            if not n3:
+                first3 = i
+            n3 += 1
+        elif n is None:
+            verb = (verb_rest if i else verb_first) or verb_base
             s = _quote_value(e)
             raise TypeError(f'Cannot {verb} non-OpenSCAD expression {s}.')
 
-    if two and three:
+    if n2 and n3:
         # OpenSCAD’s behaviour is poorly defined. Best not to transpile.
-        s = f'Cannot {verb_base} mixed 2D and 3D expressions.'
-        if len(two) == 1 and len(three) != 1:
-            s += f' One, in place {two[0] + 1} of {len(expressions)}, is 2D.'
-        elif len(two) != 1 and len(three) == 1:
-            s += f' One, in place {three[0] + 1} of {len(expressions)}, is 3D.'
-        raise DimensionalityMismatchError(s)
-
-    if two:
+        _raise_mixed(verb_base, n2, n3, first2, first3, len(expressions))
+
+    if n2:
         return 2
 
     # Assume object(s) of unknown dimensionality can be treated as 3D.
     return 3
 
 
+def sole_dimensionality(verb: str, expression: d.LiteralExpression) -> int:
+    """Determine the dimensionality of a single expression.
+
+    This is equivalent to dimensionality(verb, (expression,)) but faster for
+    the types already seen, as is typical of modifiers.
+
+    """
+    n = _DIMENSIONS.get(type(expression))
+    if n is None:
+        # Classify the expression or explain why it can’t be used.
+        return dimensionality(verb, (expression,))
+    return n or 3
+
+
 def matched(
     verb: str,
     argument: tuple[float, ...],
@@ -63,9 +75,10 @@ def matched(
 
     """
     n0 = len(argument)
-    nx = len(expressions)
-    suffix = '' if nx == 1 else 's'
+    if (n0 == 2 or n0 == 3) and n0 == dimensionality(verb, expressions):
+        return n0
 
+    suffix = '' if len(expressions) == 1 else 's'
     if n0 == 2:
         n1 = 3
     elif n0 == 3:
@@ -75,10 +88,6 @@ def matched(
             f'Cannot {verb} OpenSCAD expression{suffix} '
             f'with {n0}D argument {argument}.'
         )
-
-    if n0 == dimensionality(verb, *expressions):
-        return n0
-
     raise DimensionalityMismatchError(
         f'Cannot {verb} {n1}D OpenSCAD expression{suffix} '
         f'with {n0}D argument {argument}.'
@@ -91,7 +100,7 @@ def modify(
     child: d.LiteralExpression,
 ) -> d.BaseModifier2D | d.BaseModifier3D:
     """Wrap up a single expression of known dimensionality."""
-    if dimensionality('modify', child) == 2:
+    if sole_dimensionality('modify', child) == 2:
         return type_2d(cast(d.LiteralExpression2D, child))
     return type_3d(cast(d.LiteralExpression3D, child))
 
@@ -103,18 +112,57 @@ def contain(
     **kwargs,
 ) -> d.BaseBoolean2D | d.BaseBoolean3D:
     """Wrap up 1+ expressions of known dimensionality."""
-    if dimensionality('contain', *children, **kwargs) == 2:
-        return type_2d(cast(tuple[d.LiteralExpression2D, ...], children))
-    return type_3d(cast(tuple[d.LiteralExpression3D, ...], children))
+    if dimensionality('contain', children, **kwargs) == 2:
+        return type_2d(cast('tuple[d.LiteralExpression2D, ...]', children))
+    return type_3d(cast('tuple[d.LiteralExpression3D, ...]', children))
+
+
+# Dimensionality by exact type of expression, with 0 for agnostic types.
+_DIMENSIONS: dict[type, int] = {}
+
+
+def _classify(cls: type) -> int | None:
+    """Find the dimensionality of instances of cls and cache it.
+
+    Return None for a class that is not an OpenSCAD expression.
+
+    """
+    for base, n in ((d.Base2D, 2), (d.Base3D, 3), (d.BaseND, 0)):
+        if issubclass(cls, base):
+            _DIMENSIONS[cls] = n
+            return n
+    return None
+
+
+def _raise_mixed(
+    verb: str, n2: int, n3: int, first2: int, first3: int, total: int
+) -> NoReturn:
+    """Explain a mix of 2D and 3D expressions.
+
+    This is kept out of dimensionality, which is called for nearly every node
+    in a CAD model, so as to keep the common path short.
+
+    """
+    s = f'Cannot {verb} mixed 2D and 3D expressions.'
+    if n2 == 1 and n3 != 1:
+        s += f' One, in place {first2 + 1} of {total}, is 2D.'
+    elif n2 != 1 and n3 == 1:
+        s += f' One, in place {first3 + 1} of {total}, is 3D.'
+    raise DimensionalityMismatchError(s)
 
 
 def _quote_value(value: Any) -> str:
-    """Describe a bad value for the benefit of the user."""
+    """Describe a bad value for the benefit of the user.
+
+    Quote only strings and numbers. Other objects, such as a list of OpenSCAD
+    expressions passed by mistake, can be arbitrarily expensive to convert to
+    a string, so they are described by type alone.
+
+    """
     t = f'of type {type(value)!r}'
-    try:
-        value = str(value)
-    except (TypeError, ValueError):
+    if not isinstance(value, (str, Number)):
         return t
+    value = str(value)
 
     if len(value) > 30:
         return f'“{value[:20]}...” (truncated) {t}'
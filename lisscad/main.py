@@ -77,11 +77,12 @@ def track(
     # ... because Typer will otherwise read “--render” as the name of the
     # directory to watch.
     sys.argv = _recompose_argv(source, sys.argv)
+    relevant = re.compile(regex).search
     while True:
         inotify = INotify()
         inotify.add_watch(source, flags.MODIFY | flags.ONESHOT)
         for event in inotify.read():
-            if re.search(regex, event.name):
+            if relevant(event.name):
                 to_python(source, cut_argv=False)
                 break
 
@@ -238,6 +239,7 @@ def _read_cache(pattern: str, n_discard: int = 100):
     references to them.
 
     """
+    search = re.compile(pattern).search if pattern else None
     staging: list[Path] = []
     for f in DIR_RECENT.glob('*'):
         raw = f.read_text()
@@ -250,5 +252,5 @@ def _read_cache(pattern: str, n_discard: int = 100):
     while len(staging) > n_discard:
         del staging[0]
     for path in reversed(staging):
-        if re.search(pattern, str(path)):
+        if search is None or search(str(path)):
             yield path
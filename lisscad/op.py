@@ -1,10 +1,8 @@
 """Usability features. Not all related to CAD."""
 
 from functools import reduce
-from itertools import starmap
 from numbers import Number
 from operator import add as _add
-from operator import mul as _mul
 from operator import sub as _sub
 from operator import truediv as _div
 
@@ -23,29 +21,43 @@ from lisscad.vocab.base import background, debug, difference, disable
 
 def sub(*args):
     """Negate, subtract, or apply OpenSCAD’s difference operation."""
+    if len(args) == 2:
+        a, b = args
+        if type(a) in _SCALARS and type(b) in _SCALARS:
+            return a - b
     if not args:
         # In Clojure, this is an ArityException.
         raise OperatorError('“-” requires at least one operand.')
     if _numeric(args):
         if len(args) == 1:
             return -args[0]
-        return reduce(_sub, args)
+        result = args[0]
+        for a in args[1:]:
+            result -= a
+        return result
     if _1dmatrices(args):
         if len(args) == 1:
             return tuple(-n for n in args[0])
-        return tuple(starmap(sub, zip(*args)))
+        return tuple(reduce(_sub, v) for v in zip(*args))
     # Arguments are not all numeric. Fall back to OpenSCAD model.
     return difference(*args)
 
 
 def mul(*args):
     """Multiply or apply OpenSCAD’s disabling modifier."""
+    if len(args) == 2:
+        a, b = args
+        if type(a) in _SCALARS and type(b) in _SCALARS:
+            return a * b
     if not args:
         return 1  # As in Clojure.
     if _numeric(args):
         if len(args) == 1:
             return args[0]  # As in Clojure.
-        return reduce(_mul, args)
+        result = args[0]
+        for a in args[1:]:
+            result *= a
+        return result
     if len(args) != 1:
         raise OperatorError('Non-numeric “*” requires exactly one operand.')
     return disable(*args)
@@ -90,12 +102,16 @@ def debug_set(arg, *args):
 
 def add(*args):
     """Add. Numbers and one-dimensional matrices only."""
+    if len(args) == 2:
+        a, b = args
+        if type(a) in _SCALARS and type(b) in _SCALARS:
+            return a + b
     if not args:
         return 0  # As in Clojure.
     if _1dmatrices(args):
         if len(args) == 1:
             return args[0]
-        return tuple(starmap(add, zip(*args)))
+        return tuple(reduce(_add, v) for v in zip(*args))
     if not _numeric(args):
         raise OperatorError('“+” is mathematical. Use “|” for unions.')
     if len(args) == 1:
@@ -105,6 +121,10 @@ def add(*args):
 
 def div(*args):
     """Divide. Numbers only."""
+    if len(args) == 2:
+        a, b = args
+        if type(a) in _SCALARS and type(b) in _SCALARS:
+            return a / b
     if not args:
         # In Clojure, this is an ArityException.
         raise OperatorError('“/” requires at least one operand.')
@@ -117,15 +137,28 @@ def div(*args):
 # INTERNAL #
 ############
 
+# Exact types of the most common operands. Two of these skip the generic path.
+_SCALARS = frozenset((int, float))
+
 
 def _numeric(args) -> bool:
-    return all(isinstance(a, Number) for a in args)
+    for a in args:
+        # The abstract base class is slow to check. Try exact types first.
+        if type(a) not in _SCALARS and not isinstance(a, Number):
+            return False
+    return True
 
 
 def _1dmatrices(args) -> bool:
     """Return True if arguments are same-length one-dimensional matrices."""
-    return (
-        all(isinstance(a, (tuple, list)) for a in args)
-        and all(map(_numeric, args))
-        and len(set(map(len, args))) == 1
-    )
+    length = None
+    for a in args:
+        if not isinstance(a, (tuple, list)):
+            return False
+        if length is None:
+            length = len(a)
+        elif len(a) != length:
+            return False
+        if not _numeric(a):
+            return False
+    return length is not None
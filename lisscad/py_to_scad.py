@@ -1,11 +1,11 @@
 """Transpilation from intermediate data structures to OpenSCAD code."""
 
+import re
 from dataclasses import fields
-from functools import partial, singledispatch
 from math import pi
+from operator import attrgetter
 from pathlib import Path
-from shlex import split
-from typing import Generator
+from typing import Any, Callable, Generator, TextIO
 
 from lisscad.data import inter as d
 
@@ -14,282 +14,460 @@ from lisscad.data import inter as d
 #############
 
 LineGen = Generator[str, None, None]
+Lines = list[str]
 
 
-@singledispatch
-def transpile(datum) -> LineGen:
-    if isinstance(datum, d.SCADTerm):
-        yield from _from_scadterm(datum)
-        return
-    raise TypeError(f'Cannot transpile {datum!r}.')
+def transpile(datum) -> Lines:
+    """Compose OpenSCAD code as a list of lines."""
+    out: Lines = []
+    _transpile(datum, out, '')
+    return out
+
+
+def transpile_to(datum, stream: TextIO) -> None:
+    """Write OpenSCAD code to a text stream, with a newline after each line.
+
+    The lines of datum are still collected and joined in memory before they
+    are written. Memory use is therefore bounded by one top-level expression,
+    not by everything a caller writes to the stream.
+
+    """
+    stream.write('\n'.join(transpile(datum)))
+    stream.write('\n')
+
+
+def _transpile(datum, out: Lines, indent: str) -> None:
+    """Walk a tree of data depth first, without recursion.
+
+    Handlers append finished lines to out. Where a datum has parts, its
+    handler pushes tasks onto the stack instead, in reverse order, along with
+    any follow-up such as a closing brace. A task without a handler of its
+    own is dispatched on the exact type of its datum.
+
+    """
+    stack: Stack = [(None, datum, indent)]
+    while stack:
+        handler, datum, indent = stack.pop()
+        if handler is None:
+            handler = _HANDLERS.get(type(datum))
+            if handler is None:
+                handler = _resolve(type(datum))
+        handler(datum, out, indent, stack)
 
 
 ###########################
 # DISPATCH IMPLEMENTATION #
 ###########################
 
+Handler = Callable[[Any, Lines, str, 'Stack'], None]
 
-@transpile.register
-def _(datum: bool) -> LineGen:
-    yield str(datum).lower()
+# Per task: A handler or None, a datum for it, and indentation.
+Task = tuple[Handler | None, Any, str]
+Stack = list[Task]
 
+# Per field: Attribute name, OpenSCAD name, default value, and whether the
+# value is an angle in radians.
+FieldMeta = tuple[str, str, Any, bool]
 
-@transpile.register
-def _(datum: int) -> LineGen:
-    yield str(datum)
+_HANDLERS: dict[type, Handler] = {}
 
 
-@transpile.register
-def _(datum: float) -> LineGen:
-    if datum.is_integer():
-        # Cut off redundant decimals; likely added by Pydantic.
-        yield from transpile(int(datum))
-        return
-    yield str(datum)
-
+def _register(*classes: type) -> Callable[[Handler], Handler]:
+    """Use decorated function to transpile instances of classes."""
 
-@transpile.register
-def _(datum: str) -> LineGen:
-    """Format a string for use in OpenSCAD, with double quotes.
-
-    Check for badly nested quotation marks assuming shell-like syntax. Raise
-    ValueError if there’s a problem.
+    def decorator(handler: Handler) -> Handler:
+        for cls in classes:
+            _HANDLERS[cls] = handler
+        return handler
 
-    """
-    candidate = f'"{datum}"'
-    n = len(
-        split(candidate)
-    )  # May raise e.g. “ValueError: No closing quotation”.
-    if n != 1:
-        # Escape codes needed.
-        raise ValueError(
-            f'Python string {datum!r} would form multiple OpenSCAD strings.'
-        )
-    yield candidate
+    return decorator
 
 
-@transpile.register
-def _(datum: Path) -> LineGen:
-    yield from transpile(str(datum))
+def _resolve(cls: type) -> Handler:
+    """Find a handler through inheritance and cache it for cls."""
+    handler = next(_HANDLERS[c] for c in cls.__mro__ if c in _HANDLERS)
+    _HANDLERS[cls] = handler
+    return handler
 
 
-@transpile.register
-def _(datum: tuple) -> LineGen:
-    # Assume contents are numbers or (nested) tuples of numbers.
-    # Comma-separate values and wrap them in an OpenSCAD list.
-    yield '[' + ', '.join(s for g in map(transpile, datum) for s in g) + ']'
+@_register(object)
+def _(datum, out: Lines, indent: str, stack: Stack) -> None:
+    raise TypeError(f'Cannot transpile {datum!r}.')
 
 
-@transpile.register
-def _(datum: d.Comment) -> LineGen:
-    for line in datum.content:
-        yield f'// {line}'
+@_register(bool)
+def _(datum: bool, out: Lines, indent: str, stack: Stack) -> None:
+    out.append(indent + _bool(datum))
 
 
-@transpile.register
-def _(datum: d.Commented2D) -> LineGen:
-    yield from transpile(datum.comment)
-    yield from transpile(datum.subject)
+@_register(int)
+def _(datum: int, out: Lines, indent: str, stack: Stack) -> None:
+    out.append(indent + _int(datum))
 
 
-@transpile.register
-def _(datum: d.Commented3D) -> LineGen:
-    yield from transpile(datum.comment)
-    yield from transpile(datum.subject)
+@_register(float)
+def _(datum: float, out: Lines, indent: str, stack: Stack) -> None:
+    out.append(indent + _float(datum))
 
 
-@transpile.register
-def _(datum: d.SpecialVariable) -> LineGen:
-    if datum.assignment_preview is None:
-        yield f'{datum.variable};'
-    elif datum.assignment_render is None:
-        v = next(transpile(datum.assignment_preview))
-        yield f'{datum.variable} = {v};'
-    else:
-        v1 = next(transpile(datum.assignment_preview))
-        v2 = next(transpile(datum.assignment_render))
-        yield f'{datum.variable} = $preview ? {v1} : {v2};'
+@_register(str)
+def _(datum: str, out: Lines, indent: str, stack: Stack) -> None:
+    out.append(indent + _string(datum))
 
 
-@transpile.register
-def _(datum: d.Echo) -> LineGen:
-    args = ', '.join(list(transpile(arg))[0] for arg in datum.content)
-    yield f'echo({args});'
+@_register(Path)
+def _(datum: Path, out: Lines, indent: str, stack: Stack) -> None:
+    out.append(indent + _string(str(datum)))
 
 
-@transpile.register
-def _(datum: d.Background2D) -> LineGen:
-    yield from _background(datum.child)
+@_register(tuple)
+def _(datum: tuple, out: Lines, indent: str, stack: Stack) -> None:
+    out.append(indent + _point(datum))
 
 
-@transpile.register
-def _(datum: d.Background3D) -> LineGen:
-    yield from _background(datum.child)
+@_register(d.Comment)
+def _(datum: d.Comment, out: Lines, indent: str, stack: Stack) -> None:
+    for line in datum.content:
+        out.append(f'{indent}// {line}')
 
 
-@transpile.register
-def _(datum: d.Debug2D) -> LineGen:
-    yield from _debug(datum.child)
+@_register(d.Commented2D, d.Commented3D)
+def _(
+    datum: d.Commented2D | d.Commented3D, out: Lines, indent: str, stack: Stack
+) -> None:
+    stack.append((None, datum.subject, indent))
+    stack.append((None, datum.comment, indent))
 
 
-@transpile.register
-def _(datum: d.Debug3D) -> LineGen:
-    yield from _debug(datum.child)
+@_register(d.SpecialVariable)
+def _(datum: d.SpecialVariable, out: Lines, indent: str, stack: Stack) -> None:
+    if datum.assignment_preview is None:
+        out.append(f'{indent}{datum.variable};')
+    elif datum.assignment_render is None:
+        v = _value(datum.assignment_preview)
+        out.append(f'{indent}{datum.variable} = {v};')
+    else:
+        v1 = _value(datum.assignment_preview)
+        v2 = _value(datum.assignment_render)
+        out.append(f'{indent}{datum.variable} = $preview ? {v1} : {v2};')
+
+
+@_register(d.Echo)
+def _(datum: d.Echo, out: Lines, indent: str, stack: Stack) -> None:
+    args = ', '.join(map(_value, datum.content))
+    out.append(f'{indent}echo({args});')
+
+
+@_register(d.BaseModifier2D, d.BaseModifier3D)
+def _(
+    datum: d.BaseModifier2D | d.BaseModifier3D,
+    out: Lines,
+    indent: str,
+    stack: Stack,
+) -> None:
+    # Collect a chain of modifiers to edit the first line of the target once.
+    symbols = datum.symbol
+    target = datum.child
+    while isinstance(target, d.BaseModifier):
+        symbols += target.symbol
+        target = target.child
+    _modifier(symbols, target, out, indent, stack)
+
+
+@_register(d.ModuleDefinition2D, d.ModuleDefinition3D)
+def _(
+    datum: d.ModuleDefinition2D | d.ModuleDefinition3D,
+    out: Lines,
+    indent: str,
+    stack: Stack,
+) -> None:
+    _contain(
+        datum.name,
+        *datum.children,
+        out=out,
+        indent=indent,
+        stack=stack,
+        prefix='module ',
+    )
 
 
-@transpile.register
-def _(datum: d.Root2D) -> LineGen:
-    yield from _root(datum.child)
+@_register(d.ModuleCall2D, d.ModuleCall3D)
+def _(
+    datum: d.ModuleCall2D | d.ModuleCall3D,
+    out: Lines,
+    indent: str,
+    stack: Stack,
+) -> None:
+    _contain(datum.name, *datum.children, out=out, indent=indent, stack=stack)
 
 
-@transpile.register
-def _(datum: d.Root3D) -> LineGen:
-    yield from _root(datum.child)
+@_register(d.ModuleCallND)
+def _(datum: d.ModuleCallND, out: Lines, indent: str, stack: Stack) -> None:
+    _contain(datum.name, out=out, indent=indent, stack=stack)
 
 
-@transpile.register
-def _(datum: d.Disable2D) -> LineGen:
-    yield from _disable(datum.child)
+@_register(d.ModuleChildren)
+def _(datum: d.ModuleChildren, out: Lines, indent: str, stack: Stack) -> None:
+    out.append(f'{indent}children();')
 
 
-@transpile.register
-def _(datum: d.Disable3D) -> LineGen:
-    yield from _disable(datum.child)
+############
+# BACK END #
+############
 
 
-@transpile.register
-def _(datum: d.ModuleDefinition2D) -> LineGen:
-    yield from _module(datum.name, *datum.children)
+def _value(datum) -> str:
+    """Format a single value, such as a number, for use in OpenSCAD.
 
+    Common types are checked exactly, without dispatch. Anything else,
+    including subclasses of those types, goes through transpile.
 
-@transpile.register
-def _(datum: d.ModuleDefinition3D) -> LineGen:
-    yield from _module(datum.name, *datum.children)
+    """
+    t = type(datum)
+    if t is float:
+        return _float(datum)
+    if t is int:
+        return _int(datum)
+    if t is tuple:
+        return _point(datum)
+    if t is bool:
+        return _bool(datum)
+    if t is str:
+        return _string(datum)
+    lines = transpile(datum)
+    assert len(lines) == 1
+    return lines[0]
 
 
-@transpile.register
-def _(datum: d.ModuleCall2D) -> LineGen:
-    yield from _contain(datum.name, *datum.children)
+_bool = {True: 'true', False: 'false'}.__getitem__
 
 
-@transpile.register
-def _(datum: d.ModuleCall3D) -> LineGen:
-    yield from _contain(datum.name, *datum.children)
+def _int(datum: int) -> str:
+    string = _SMALL_INTS.get(datum)
+    return str(datum) if string is None else string
 
 
-@transpile.register
-def _(datum: d.ModuleCallND) -> LineGen:
-    yield from _contain(datum.name)
+# Integers common in CAD models: Coordinates, angles, counts, etc.
+_SMALL_INTS = {i: str(i) for i in range(-360, 361)}
 
 
-@transpile.register
-def _(datum: d.ModuleChildren) -> LineGen:
-    yield 'children();'
+def _float(datum: float) -> str:
+    if datum.is_integer():
+        # Cut off redundant decimals; likely added by Pydantic.
+        return _int(int(datum))
+    return repr(datum)
 
 
-############
-# BACK END #
-############
+def _string(datum: str) -> str:
+    """Format a string for use in OpenSCAD, with double quotes.
 
+    Check for quotation marks that are not escaped with a backslash, and for a
+    trailing backslash that would escape the closing quotation mark. Raise
+    ValueError if there’s a problem.
 
-def _rad_to_deg(radians: float) -> float:
-    return (radians * 180) / pi
+    """
+    if not _ESCAPED_STRING(datum):
+        # Escape codes needed.
+        raise ValueError(
+            f'Python string {datum!r} would form multiple OpenSCAD strings.'
+        )
+    return f'"{datum}"'
 
 
-def _modifier(symbol: str, target: d.LiteralExpression) -> LineGen:
-    """Prepend a modifier to OpenSCAD code."""
-    head, *tail = transpile(target)
-    yield symbol + head
-    yield from tail
+_ESCAPED_STRING = re.compile(r'(?:[^"\\]|\\.)*', re.DOTALL).fullmatch
 
 
-_background = partial(_modifier, '%')
-_debug = partial(_modifier, '#')
-_root = partial(_modifier, '!')
-_disable = partial(_modifier, '*')
+def _tuple(datum: tuple) -> str:
+    # Assume contents are numbers or (nested) tuples of numbers.
+    # Comma-separate values and wrap them in an OpenSCAD list.
+    types = set(map(type, datum))
+    if types <= _JUST_INT:
+        # Python’s representation is equivalent but for brackets and 1-tuples.
+        return '[' + repr(datum)[1:-1].rstrip(',') + ']'
+    if types <= _JUST_FLOAT:
+        return '[' + ', '.join(map(_float, datum)) + ']'
+    if types <= _JUST_TUPLE:
+        # Points, paths, faces and matrices.
+        return '[' + ', '.join(map(_point, datum)) + ']'
+    return '[' + ', '.join(map(_value, datum)) + ']'
+
+
+def _point(datum: tuple) -> str:
+    # Polygons can have thousands of points, and most transformations take a
+    # vector. Format short tuples of one numeric type with neither a set of
+    # types nor a join.
+    if len(datum) == 2:
+        x, y = datum
+        f = _SCALAR_FORMATTERS.get(type(x))
+        if f is not None and type(y) is type(x):
+            return f'[{f(x)}, {f(y)}]'
+    elif len(datum) == 3:
+        x, y, z = datum
+        f = _SCALAR_FORMATTERS.get(type(x))
+        if f is not None and type(y) is type(x) and type(z) is type(x):
+            return f'[{f(x)}, {f(y)}, {f(z)}]'
+    return _tuple(datum)
+
+
+_SCALAR_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    float: _float,
+    int: _int,
+}
+_JUST_INT = frozenset((int,))
+_JUST_FLOAT = frozenset((float,))
+_JUST_TUPLE = frozenset((tuple,))
+
+
+def _modifier(
+    symbol: str,
+    target: d.LiteralExpression,
+    out: Lines,
+    indent: str,
+    stack: Stack,
+) -> None:
+    """Prepend a modifier to OpenSCAD code, once the target is done."""
+    stack.append((_prepend, (symbol, len(out)), indent))
+    stack.append((None, target, indent))
+
+
+def _prepend(
+    task: tuple[str, int], out: Lines, indent: str, stack: Stack
+) -> None:
+    """Insert symbol after indentation at an index into out."""
+    symbol, start = task
+    out[start] = indent + symbol + out[start][len(indent) :]
+
+
+def _append(line: str, out: Lines, indent: str, stack: Stack) -> None:
+    """Add an indented line of finished OpenSCAD code."""
+    out.append(indent + line)
 
 
 def _contain(
     keyword: str,
     *body: d.LiteralExpression,
+    out: Lines,
+    indent: str,
+    stack: Stack,
     prefix: str = '',
     head: str = '',
     postfix: str = ';',
-) -> LineGen:
+) -> None:
     """Compose OpenSCAD code for a branch expression."""
-    lead = f'{prefix}{keyword}({head}) '
+    # Build each line in one step, without intermediate concatenation.
     if body:
-        yield lead + '{'
-        for child in body:
-            for line in transpile(child):
-                yield f'    {line}'
-        yield '}' + postfix
-    else:
-        yield lead + '{}' + postfix
-
-
-def _terminate(
-    keyword: str, prefix: str = '', head: str = '', postfix: str = ';'
-) -> str:
-    """Compose OpenSCAD code for a leaf expression."""
-    return f'{prefix}{keyword}({head}){postfix}'
-
-
-def _format(
-    keyword: str, *body: d.LiteralExpression, container: bool = True, **kwargs
-) -> LineGen:
-    """Compose typical OpenSCAD code."""
-    if container or body:
-        yield from _contain(keyword, *body, **kwargs)
+        out.append(f'{indent}{prefix}{keyword}({head}) {{')
+        stack.append((_append, f'}}{postfix}', indent))
+        inner = indent + '    '
+        stack.extend([(None, child, inner) for child in reversed(body)])
     else:
-        yield _terminate(keyword, **kwargs)
+        out.append(f'{indent}{prefix}{keyword}({head}) {{}}{postfix}')
 
 
 def _fields_from_dataclass(
-    datum: d.SCADTerm,
-    denylist: frozenset[str] = frozenset(['child', 'children']),
-    rad: frozenset[str] = frozenset(['angle', 'twist']),
-) -> LineGen:
-    """Generate minimal OpenSCAD from dataclass fields.
+    values: tuple, meta: tuple[FieldMeta, ...], out: Lines
+) -> None:
+    """Compose minimal OpenSCAD from dataclass fields.
 
     This will only work where field names on the dataclass already match
     OpenSCAD or are translated using field_names in metadata.
 
     """
-    field_names = datum.scad.field_names
-    for f in fields(datum):
-        if f.name in denylist:
-            continue
-        value = getattr(datum, f.name)
-        if value == f.default:
+    for value, (_, name, default, is_rad) in zip(values, meta):
+        if value is default or value == default:
             continue
-        if f.name in rad:
+        if is_rad:
+            # Multiplying by a precomputed 180 / π would round differently.
             if isinstance(value, float):
-                value = _rad_to_deg(value)
+                value = value * 180 / pi
             else:
-                value = tuple(map(_rad_to_deg, value))
-        name = field_names.get(f.name, f.name)
-        csv = list(transpile(value))
-        assert len(csv) == 1
-        yield f'{name}={csv[0]}'
-
-
-def _from_scadterm(datum: d.SCADTerm, **kwargs) -> LineGen:
-    """Grab metadata about a typical OpenSCAD term from its precursor."""
-    container = False
-    children: tuple[d.LiteralExpression, ...] = ()
-    if container_attr := datum.scad.container:
-        container = True
-        children = getattr(datum, container_attr)
-        if not isinstance(children, tuple):
-            children = (children,)
-
-    yield from _format(
-        datum.scad.keyword,
-        *children,
-        container=container,
-        head=', '.join(_fields_from_dataclass(datum)),
+                value = tuple(v * 180 / pi for v in value)
+        out.append(f'{name}={_value(value)}')
+
+
+def _describe_fields(
+    cls: type,
+    denylist: frozenset[str] = frozenset(['child', 'children']),
+    rad: frozenset[str] = frozenset(['angle', 'twist']),
+) -> tuple[FieldMeta, ...]:
+    """Find what it takes to transpile fields of a dataclass."""
+    field_names = cls.scad.field_names  # type: ignore[attr-defined]
+    return tuple(
+        (f.name, field_names.get(f.name, f.name), f.default, f.name in rad)
+        for f in fields(cls)
+        if f.name not in denylist
     )
 
 
-_module = partial(_contain, prefix='module ')
+def _getter(meta: tuple[FieldMeta, ...]) -> Callable[[Any], tuple]:
+    """Fetch the values of all described fields in one call."""
+    get = attrgetter(*(attr for attr, *_ in meta))
+    if len(meta) == 1:
+        return lambda datum: (get(datum),)
+    return get
+
+
+def _from_scadterm(
+    datum: d.SCADTerm, out: Lines, indent: str, stack: Stack
+) -> None:
+    """Transpile a typical OpenSCAD term.
+
+    Replace this generic handler with one specialized for the type of datum,
+    for use on later instances of the same type.
+
+    """
+    handler = _HANDLERS[type(datum)] = _specialize(type(datum))
+    handler(datum, out, indent, stack)
+
+
+def _specialize(cls: type) -> Handler:
+    """Grab metadata about a typical OpenSCAD term from its precursor class."""
+    keyword = cls.scad.keyword  # type: ignore[attr-defined]
+    container_attr = cls.scad.container  # type: ignore[attr-defined]
+    meta = _describe_fields(cls)
+    # By convention in the data model, a lone expression is a “child”.
+    single = container_attr == 'child'
+
+    if meta:
+        values = _getter(meta)
+
+        def head(datum: d.SCADTerm) -> str:
+            fields_: Lines = []
+            _fields_from_dataclass(values(datum), meta, fields_)
+            return ', '.join(fields_)
+    else:
+
+        def head(datum: d.SCADTerm) -> str:
+            return ''
+
+    if not container_attr:
+        # A leaf expression always fits one line, opening with the keyword.
+        opening = keyword + '('
+
+        def leaf(
+            datum: d.SCADTerm, out: Lines, indent: str, stack: Stack
+        ) -> None:
+            out.append(f'{indent}{opening}{head(datum)});')
+
+        return leaf
+
+    def branch(
+        datum: d.SCADTerm, out: Lines, indent: str, stack: Stack
+    ) -> None:
+        children = getattr(datum, container_attr)
+        body: tuple[d.LiteralExpression, ...] = (
+            (children,) if single else children
+        )
+        _contain(
+            keyword,
+            *body,
+            out=out,
+            indent=indent,
+            stack=stack,
+            head=head(datum),
+        )
+
+    return branch
+
+
+_register(d.SCADTerm)(_from_scadterm)
@@ -7,12 +7,18 @@ The module is intended to be star-imported from CAD scripts via a Lissp macro.
 
 """
 
-from functools import partial
+from os.path import splitext
 from pathlib import Path
 from typing import cast
 
 import lisscad.data.inter as d
-from lisscad.data.util import contain, dimensionality, matched, modify
+from lisscad.data.util import (
+    contain,
+    dimensionality,
+    matched,
+    modify,
+    sole_dimensionality,
+)
 from lisscad.exc import DimensionalityError, LisscadError
 
 ############
@@ -22,9 +28,9 @@ from lisscad.exc import DimensionalityError, LisscadError
 __all__: list[str] = []
 
 
-def _starred(member, name: str = ''):
+def _starred(member):
     """Expose decorated member of module for star import."""
-    __all__.append(name or member.__name__)
+    __all__.append(member.__name__)
     return member
 
 
@@ -48,7 +54,7 @@ def comment(
     c = d.Comment(content)
     if subject is None:
         return c
-    if dimensionality('comment', subject) == 2:
+    if sole_dimensionality('comment', subject) == 2:
         return d.Commented2D(c, cast(d.LiteralExpression2D, subject))
     return d.Commented3D(c, cast(d.LiteralExpression3D, subject))
 
@@ -57,7 +63,7 @@ def comment(
 def background(child: d.LiteralExpression) -> d.Background2D | d.Background3D:
     """Implement OpenSCAD’s % modifier, known as transparent or background."""
     return cast(
-        d.Background2D | d.Background3D,
+        'd.Background2D | d.Background3D',
         modify(d.Background2D, d.Background3D, child),
     )
 
@@ -65,20 +71,20 @@ def background(child: d.LiteralExpression) -> d.Background2D | d.Background3D:
 @_starred
 def debug(child: d.LiteralExpression) -> d.Debug2D | d.Debug3D:
     """Implement OpenSCAD’s # modifier, known as highlight or debug."""
-    return cast(d.Debug2D | d.Debug3D, modify(d.Debug2D, d.Debug3D, child))
+    return cast('d.Debug2D | d.Debug3D', modify(d.Debug2D, d.Debug3D, child))
 
 
 @_starred
 def root(child: d.LiteralExpression) -> d.Root2D | d.Root3D:
     """Implement OpenSCAD’s ! modifier, known as show-only or root."""
-    return cast(d.Root2D | d.Root3D, modify(d.Root2D, d.Root3D, child))
+    return cast('d.Root2D | d.Root3D', modify(d.Root2D, d.Root3D, child))
 
 
 @_starred
 def disable(child: d.LiteralExpression) -> d.Disable2D | d.Disable3D:
     """Implement OpenSCAD’s * modifier, known as disable."""
     return cast(
-        d.Disable2D | d.Disable3D, modify(d.Disable2D, d.Disable3D, child)
+        'd.Disable2D | d.Disable3D', modify(d.Disable2D, d.Disable3D, child)
     )
 
 
@@ -102,7 +108,9 @@ def special(variable, *values: float | int) -> d.SpecialVariable:
 def union(*children: d.LiteralExpression | tuple[()]) -> d.Union2D | d.Union3D:
     some = _some(children)
     try:
-        return cast(d.Union2D | d.Union3D, contain(d.Union2D, d.Union3D, some))
+        return cast(
+            'd.Union2D | d.Union3D', contain(d.Union2D, d.Union3D, some)
+        )
     except DimensionalityError as exc:
         raise LisscadError(f'Invalid union: {exc}') from exc
 
@@ -113,11 +121,11 @@ def difference(
 ) -> d.Difference2D | d.Difference3D:
     subtrahend = _some(children)
     return cast(
-        d.Difference2D | d.Difference3D,
+        'd.Difference2D | d.Difference3D',
         contain(
             d.Difference2D,
             d.Difference3D,
-            (minuend, *subtrahend),
+            (minuend,) + subtrahend,
             verb_first='subtract from',
             verb_rest='subtract',
         ),
@@ -130,7 +138,7 @@ def intersection(
 ) -> d.Intersection2D | d.Intersection3D:
     some = _some(children)
     return cast(
-        d.Intersection2D | d.Intersection3D,
+        'd.Intersection2D | d.Intersection3D',
         contain(d.Intersection2D, d.Intersection3D, some),
     )
 
@@ -163,20 +171,10 @@ def text(text: str, **kwargs) -> d.Text:
 def import_(file: Path, **kwargs) -> d.Import2D | d.Import3D:
     # The word “import” is reserved in Python, unusable in Lissp.
     # The alias “import_” is also used in SolidPython.
-    match Path(file).suffix.lower():
-        case '.3mf':
-            return d.Import3D(file, **kwargs)
-        case '.amf':
-            return d.Import3D(file, **kwargs)
-        case '.dxf':
-            return d.Import2D(file, **kwargs)
-        case '.off':
-            return d.Import3D(file, **kwargs)
-        case '.stl':
-            return d.Import3D(file, **kwargs)
-        case '.svg':
-            return d.Import2D(file, **kwargs)
-    raise ValueError(f'Unknown file suffix for {file}.')
+    cls = _IMPORT_BY_SUFFIX.get(splitext(file)[1].lower())
+    if cls is None:
+        raise ValueError(f'Unknown file suffix for {file}.')
+    return cls(file, **kwargs)
 
 
 @_starred
@@ -192,7 +190,10 @@ def projection(
     return d.Projection(child, cut=cut)
 
 
-cut = _starred(partial(projection, cut=True), name='cut')
+@_starred
+def cut(child: d.LiteralExpressionNon2D) -> d.Projection:
+    """Implement an OpenSCAD projection with cutting."""
+    return d.Projection(child, cut=True)
 
 
 @_starred
@@ -244,11 +245,11 @@ def translate(
     if matched('translate', coord, children) == 2:
         return d.Translation2D(
             cast(d.Tuple2D, coord),
-            cast(tuple[d.LiteralExpression2D, ...], children),
+            cast('tuple[d.LiteralExpression2D, ...]', children),
         )
     return d.Translation3D(
         cast(d.Tuple3D, coord),
-        cast(tuple[d.LiteralExpression3D, ...], children),
+        cast('tuple[d.LiteralExpression3D, ...]', children),
     )
 
 
@@ -258,10 +259,10 @@ def rotate(
 ) -> d.Rotation2D | d.Rotation3D:
     if isinstance(angles, (float, int)):
         return d.Rotation2D(
-            angles, cast(tuple[d.LiteralExpression2D, ...], children)
+            angles, cast('tuple[d.LiteralExpression2D, ...]', children)
         )
     return d.Rotation3D(
-        angles, cast(tuple[d.LiteralExpression3D, ...], children)
+        angles, cast('tuple[d.LiteralExpression3D, ...]', children)
     )
 
 
@@ -272,11 +273,11 @@ def scale(
     if matched('scale', factors, children) == 2:
         return d.Scaling2D(
             cast(d.Tuple2D, factors),
-            cast(tuple[d.LiteralExpression2D, ...], children),
+            cast('tuple[d.LiteralExpression2D, ...]', children),
         )
     return d.Scaling3D(
         cast(d.Tuple3D, factors),
-        cast(tuple[d.LiteralExpression3D, ...], children),
+        cast('tuple[d.LiteralExpression3D, ...]', children),
     )
 
 
@@ -287,11 +288,11 @@ def resize(
     if matched('resize', size, children) == 2:
         return d.Size2D(
             cast(d.Tuple2D, size),
-            cast(tuple[d.LiteralExpression2D, ...], children),
+            cast('tuple[d.LiteralExpression2D, ...]', children),
         )
     return d.Size3D(
         cast(d.Tuple3D, size),
-        cast(tuple[d.LiteralExpression3D, ...], children),
+        cast('tuple[d.LiteralExpression3D, ...]', children),
     )
 
 
@@ -300,11 +301,13 @@ def mirror(
     axes: tuple[int, int, int], *children: d.LiteralExpression
 ) -> d.Mirror2D | d.Mirror3D:
     # Do not require dimensionality of axes to match that of children.
-    if dimensionality('mirror', *children) == 2:
+    if dimensionality('mirror', children) == 2:
         return d.Mirror2D(
-            axes, cast(tuple[d.LiteralExpression2D, ...], children)
+            axes, cast('tuple[d.LiteralExpression2D, ...]', children)
         )
-    return d.Mirror3D(axes, cast(tuple[d.LiteralExpression3D, ...], children))
+    return d.Mirror3D(
+        axes, cast('tuple[d.LiteralExpression3D, ...]', children)
+    )
 
 
 @_starred
@@ -313,12 +316,12 @@ def multmatrix(
 ) -> d.AffineTransformation2D | d.AffineTransformation3D:
     # OpenSCAD can apply a multmatrix to a two-dimensional object, but as of
     # 2022 there are no examples or specifications in the manual.
-    if dimensionality('transform', *children) == 2:
+    if dimensionality('transform', children) == 2:
         return d.AffineTransformation2D(
-            matrix, cast(tuple[d.LiteralExpression2D, ...], children)
+            matrix, cast('tuple[d.LiteralExpression2D, ...]', children)
         )
     return d.AffineTransformation3D(
-        matrix, cast(tuple[d.LiteralExpression3D, ...], children)
+        matrix, cast('tuple[d.LiteralExpression3D, ...]', children)
     )
 
 
@@ -326,11 +329,13 @@ def multmatrix(
 def color(
     value: d.Tuple4D | str, *children: d.LiteralExpression
 ) -> d.Color2D | d.Color3D:
-    if dimensionality('color', *children) == 2:
+    if dimensionality('color', children) == 2:
         return d.Color2D(
-            value, cast(tuple[d.LiteralExpression2D, ...], children)
+            value, cast('tuple[d.LiteralExpression2D, ...]', children)
         )
-    return d.Color3D(value, cast(tuple[d.LiteralExpression3D, ...], children))
+    return d.Color3D(
+        value, cast('tuple[d.LiteralExpression3D, ...]', children)
+    )
 
 
 @_starred
@@ -348,21 +353,21 @@ def offset(
 
 @_starred
 def hull(*children: d.LiteralExpression) -> d.Hull2D | d.Hull3D:
-    if dimensionality('form a hull around', *children) == 2:
-        return d.Hull2D(cast(tuple[d.LiteralExpression2D, ...], children))
-    return d.Hull3D(cast(tuple[d.LiteralExpression3D, ...], children))
+    if dimensionality('form a hull around', children) == 2:
+        return d.Hull2D(cast('tuple[d.LiteralExpression2D, ...]', children))
+    return d.Hull3D(cast('tuple[d.LiteralExpression3D, ...]', children))
 
 
 @_starred
 def minkowski(
     *children: d.LiteralExpression, **kwargs
 ) -> d.MinkowskiSum2D | d.MinkowskiSum3D:
-    if dimensionality('minkowski-add', *children) == 2:
+    if dimensionality('minkowski-add', children) == 2:
         return d.MinkowskiSum2D(
-            cast(tuple[d.LiteralExpression2D, ...], children), **kwargs
+            cast('tuple[d.LiteralExpression2D, ...]', children), **kwargs
         )
     return d.MinkowskiSum3D(
-        cast(tuple[d.LiteralExpression3D, ...], children), **kwargs
+        cast('tuple[d.LiteralExpression3D, ...]', children), **kwargs
     )
 
 
@@ -383,9 +388,9 @@ def module(name: str, *children: d.LiteralExpression, call=False):
 
     """
     if call:
-        return _call_module(name, *children)
+        return _call_module(name, children)
     assert children
-    return _define_module(name, *children)
+    return _define_module(name, children)
 
 
 @_starred
@@ -405,7 +410,7 @@ def children() -> d.ModuleChildren:
     Neither indexing nor counting of children are currently supported.
 
     """
-    return d.ModuleChildren()
+    return _CHILDREN
 
 
 ############
@@ -416,11 +421,26 @@ def children() -> d.ModuleChildren:
 def _some(
     items: tuple[d.LiteralExpression | tuple[()], ...],
 ) -> tuple[d.LiteralExpression, ...]:
-    return tuple(filter(lambda x: x != (), items))  # type: ignore[arg-type]
+    # Check types before comparing, since an expression’s __eq__ is slow.
+    some = [x for x in items if type(x) is not tuple or x]
+    return tuple(some)  # type: ignore[arg-type]
+
+
+# The placeholder has no fields, so one immutable instance serves every call.
+_CHILDREN = d.ModuleChildren()
+
+_IMPORT_BY_SUFFIX: dict[str, type[d.Import2D] | type[d.Import3D]] = {
+    '.3mf': d.Import3D,
+    '.amf': d.Import3D,
+    '.dxf': d.Import2D,
+    '.off': d.Import3D,
+    '.stl': d.Import3D,
+    '.svg': d.Import2D,
+}
 
 
 def _define_module(
-    name: str, *children: d.LiteralExpression
+    name: str, children: tuple[d.LiteralExpression, ...]
 ) -> d.ModuleDefinition2D | d.ModuleDefinition3D:
     """Define an OpenSCAD module.
 
@@ -431,24 +451,24 @@ def _define_module(
     Like scad-clj, lisscad does not support arguments to modules.
 
     """
-    if dimensionality('define module of', *children) == 2:
+    if dimensionality('define module of', children) == 2:
         return d.ModuleDefinition2D(
-            name, cast(tuple[d.LiteralExpression2D, ...], children)
+            name, cast('tuple[d.LiteralExpression2D, ...]', children)
         )
     return d.ModuleDefinition3D(
-        name, cast(tuple[d.LiteralExpression3D, ...], children)
+        name, cast('tuple[d.LiteralExpression3D, ...]', children)
     )
 
 
 def _call_module(
-    name: str, *children: d.LiteralExpression
+    name: str, children: tuple[d.LiteralExpression, ...]
 ) -> d.ModuleCall2D | d.ModuleCall3D | d.ModuleCallND:
     if children:
-        if dimensionality('call module using', *children) == 2:
+        if dimensionality('call module using', children) == 2:
             return d.ModuleCall2D(
-                name, cast(tuple[d.LiteralExpression2D, ...], children)
+                name, cast('tuple[d.LiteralExpression2D, ...]', children)
             )
         return d.ModuleCall3D(
-            name, cast(tuple[d.LiteralExpression3D, ...], children)
+            name, cast('tuple[d.LiteralExpression3D, ...]', children)
         )
     return d.ModuleCallND(name)
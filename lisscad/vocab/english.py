@@ -3,7 +3,7 @@
 from typing import cast
 
 import lisscad.data.inter as d
-from lisscad.data.util import dimensionality
+from lisscad.data.util import dimensionality, sole_dimensionality
 from lisscad.vocab import base
 
 ##########
@@ -80,13 +80,15 @@ def left(
     distance: float, *children: d.LiteralExpression
 ) -> d.Translation2D | d.Translation3D:
     """Translate along negative x."""
-    n = dimensionality('translate', *children)
+    n = _dimensionality(children)
     if n == 2:
         return d.Translation2D(
-            (-distance, 0), cast(tuple[d.LiteralExpression2D, ...], children)
+            (-distance, 0.0),
+            cast('tuple[d.LiteralExpression2D, ...]', children),
         )
     return d.Translation3D(
-        (-distance, 0, 0), cast(tuple[d.LiteralExpression3D, ...], children)
+        (-distance, 0.0, 0.0),
+        cast('tuple[d.LiteralExpression3D, ...]', children),
     )
 
 
@@ -101,13 +103,15 @@ def back(
     distance: float, *children: d.LiteralExpression
 ) -> d.Translation2D | d.Translation3D:
     """Translate along negative y."""
-    n = dimensionality('translate', *children)
+    n = _dimensionality(children)
     if n == 2:
         return d.Translation2D(
-            (0, -distance), cast(tuple[d.LiteralExpression2D, ...], children)
+            (0.0, -distance),
+            cast('tuple[d.LiteralExpression2D, ...]', children),
         )
     return d.Translation3D(
-        (0, -distance, 0), cast(tuple[d.LiteralExpression3D, ...], children)
+        (0.0, -distance, 0.0),
+        cast('tuple[d.LiteralExpression3D, ...]', children),
     )
 
 
@@ -120,9 +124,22 @@ def forward(
 
 def down(distance: float, *children: d.LiteralExpression3D) -> d.Translation3D:
     """Translate along negative z."""
-    return d.Translation3D((0, 0, -distance), children)
+    return d.Translation3D((0.0, 0.0, -distance), children)
 
 
 def up(distance: float, *children: d.LiteralExpression3D) -> d.Translation3D:
     """Translate along positive z."""
     return down(-distance, *children)
+
+
+############
+# INTERNAL #
+############
+
+
+def _dimensionality(children: tuple[d.LiteralExpression, ...]) -> int:
+    """Determine the dimensionality of children to translate."""
+    if len(children) == 1:
+        # The typical case. Skip the general scan.
+        return sole_dimensionality('translate', children[0])
+    return dimensionality('translate', children)
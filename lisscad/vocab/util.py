@@ -3,7 +3,6 @@
 from builtins import round as round_number
 from typing import Any, Callable, Iterable, cast
 
-import more_itertools as mi
 from lisscad.data.inter import (
     AngledOffset,
     LinearExtrusion,
@@ -40,11 +39,21 @@ def sliding_hull(*shapes: LiteralExpression, n: int = 2):
     [B, C, D] and the hull of [C, D, E].
 
     """
-    return union(*(hull(*w) for w in mi.sliding_window(shapes, n)))
+    if n < 1:
+        raise LisscadError(f'Invalid sliding hull: Window of {n} shapes.')
+    return union(
+        *[hull(*shapes[i : i + n]) for i in range(len(shapes) - n + 1)]
+    )
 
 
 def radiate(hub: LiteralExpression, *spokes: LiteralExpression):
-    return sliding_hull(*mi.intersperse(hub, spokes))
+    if len(spokes) == 1:
+        # There is no pair of spokes to put the hub between.
+        return sliding_hull(hub, *spokes)
+    # Put the hub between each pair of spokes.
+    shapes = [hub] * (2 * len(spokes) - 1)
+    shapes[::2] = spokes
+    return sliding_hull(*shapes)
 
 
 def round(
@@ -66,7 +75,7 @@ def round(
         assert not shapes
         return round_number(radius, ndigits=ndigits)
     inner = offset(
-        -radius, *cast(tuple[LiteralExpressionNon3D, ...], shapes), **kwargs
+        -radius, *cast('tuple[LiteralExpressionNon3D, ...]', shapes), **kwargs
     )
     return offset(radius, inner, **kwargs)
 
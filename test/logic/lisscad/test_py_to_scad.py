@@ -0,0 +1,68 @@
+"""Unit tests for the corresponding module."""
+
+from contextlib import nullcontext as does_not_raise
+from io import StringIO
+
+from lisscad.py_to_scad import transpile, transpile_to
+from lisscad.vocab.base import background, circle, square, translate, union
+from pytest import mark, raises
+
+
+@mark.parametrize(
+    '_, string, verdict',
+    [
+        ('empty', '', does_not_raise()),
+        ('plain', 'abc', does_not_raise()),
+        ('escaped_quote', r'a\"b', does_not_raise()),
+        ('escaped_backslash', 'a\\\\', does_not_raise()),
+        ('newline', 'a\nb', does_not_raise()),
+        ('bare_quote', '"', raises(ValueError)),
+        ('inner_quote', 'a"b', raises(ValueError)),
+        ('inner_quotes', 'a"b"c', raises(ValueError)),
+        ('trailing_backslash', 'a\\', raises(ValueError)),
+    ],
+)
+def test_string(_, string, verdict):
+    """Check that strings cannot break out of their OpenSCAD quotes."""
+    with verdict:
+        assert transpile(string) == [f'"{string}"']
+
+
+@mark.parametrize(
+    '_, datum, oracle',
+    [
+        ('empty', (), '[]'),
+        ('ints', (1, -2), '[1, -2]'),
+        ('int_1tuple', (1,), '[1]'),
+        ('floats', (0.5, 2.0), '[0.5, 2]'),
+        ('mixed', (1, 0.5), '[1, 0.5]'),
+        ('ints_3d', (1, 0, -1), '[1, 0, -1]'),
+        ('bools', (True, False), '[true, false]'),
+        ('points_2d', ((0.5, 1.0), (2.0, 0.25)), '[[0.5, 1], [2, 0.25]]'),
+        ('points_3d', ((0.5, 1.0, 0.0),), '[[0.5, 1, 0]]'),
+        ('points_mixed', ((1, 0.5), (1.0, 2.0, 3)), '[[1, 0.5], [1, 2, 3]]'),
+        ('nested', (((1,),),), '[[[1]]]'),
+    ],
+)
+def test_tuple(_, datum, oracle):
+    """Check that tuples become OpenSCAD lists."""
+    assert transpile(datum) == [oracle]
+
+
+def test_transpile_to():
+    """Check that streaming matches the list of lines."""
+    datum = union(circle(1), square((1, 2)))
+    stream = StringIO()
+    transpile_to(datum, stream)
+    assert stream.getvalue() == '\n'.join(transpile(datum)) + '\n'
+
+
+def test_deep_nesting():
+    """Check that nesting is not limited by Python’s recursion limit."""
+    depth = 2000
+    datum = background(circle(1))
+    for _ in range(depth):
+        datum = translate((1, 0), datum)
+    lines = transpile(datum)
+    assert len(lines) == 2 * depth + 1
+    assert lines[depth] == depth * '    ' + '%circle(r=1);'
@@ -84,7 +84,9 @@ from pytest import mark, raises
             ((), circle(1)),
             raises(
                 DimensionalityMismatchError,
-                match='Cannot translate OpenSCAD expression with 0D argument ().',
+                match=re.escape(
+                    'Cannot translate OpenSCAD expression with 0D argument ().'
+                ),
             ),
         ),
         (
@@ -0,0 +1,38 @@
+"""Unit tests for the corresponding module."""
+
+from lisscad.data.inter import Circle, Hull2D, Union2D
+from lisscad.exc import LisscadError
+from lisscad.vocab.util import radiate
+from pytest import mark, raises
+
+HUB = Circle(1)
+SPOKES = (Circle(2), Circle(3), Circle(4))
+
+
+@mark.parametrize(
+    '_, spokes, oracle',
+    [
+        ('one_spoke', SPOKES[:1], Union2D((Hull2D((HUB, SPOKES[0])),))),
+        (
+            'three_spokes',
+            SPOKES,
+            Union2D(
+                (
+                    Hull2D((SPOKES[0], HUB)),
+                    Hull2D((HUB, SPOKES[1])),
+                    Hull2D((SPOKES[1], HUB)),
+                    Hull2D((HUB, SPOKES[2])),
+                )
+            ),
+        ),
+    ],
+)
+def test_radiate(_, spokes, oracle):
+    """Check that the hub is hulled with each spoke."""
+    assert radiate(HUB, *spokes) == oracle
+
+
+def test_radiate_without_spokes():
+    """Check that there must be something to radiate."""
+    with raises(LisscadError):
+        radiate(HUB)
@@ -11,13 +11,13 @@ from pytest import fail, mark, skip
 
 from lisscad.app import _compose_scad_output_path, _process_all, write
 
-CASES = [(p.name, p) for p in sorted(Path('test/data/').glob('*'))]
+CASES = sorted(Path('test/data/').glob('*'))
 
 FILE_RENDERCALLS = 'rendercalls.py'
 
 
-@mark.parametrize('_, case', CASES)
-def test_lissp_to_scad(_, case, tmp_path, pytestconfig):
+@mark.parametrize('case', CASES, ids=lambda p: p.name)
+def test_lissp_to_scad(case, tmp_path, pytestconfig):
     """Compare a prepared set of files with outputs from them.
 
     If the custom “adopt” option has been passed to pytest, replace oracles
@@ -118,20 +118,6 @@ def test_lissp_to_scad(_, case, tmp_path, pytestconfig):
         skip('New output adopted.')
 
 
-class _MockProcess(Mock):
-    """Imitate the interface of multiprocessing.Process."""
-
-    def __init__(self, target, args):
-        super().__init__()
-        target(*args)  # Call target in calling thread.
-
-    def start(self):
-        pass
-
-    def join(self):
-        pass
-
-
 def _check_processes(
     adopt: bool, file: Path, calls: list[tuple[str, ...]]
 ) -> bool: